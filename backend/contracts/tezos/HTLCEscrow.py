@@ -11,17 +11,30 @@ def main():
     """
     
     # Type definitions for contract storage and parameters
+    swap_status_type: type = sp.variant(
+        active=sp.unit,
+        claimed=sp.unit,
+        refunded=sp.unit
+    )
+    
+    # Escrowed asset: XTZ net of fees, or an FA2 token amount
+    asset_type: type = sp.variant(
+        xtz=sp.mutez,
+        fa2=sp.record(
+            token_address=sp.address,
+            token_id=sp.nat,
+            token_amount=sp.nat
+        )
+    )
+    
     swap_type: type = sp.record(
         swap_id=sp.nat,
         maker=sp.address,
         taker=sp.option[sp.address],
-        amount=sp.mutez,
-        token_address=sp.option[sp.address],
-        token_id=sp.option[sp.nat],
-        token_amount=sp.option[sp.nat],
+        asset=asset_type,
         secret_hash=sp.bytes,
         timelock=sp.timestamp,
-        status=sp.string,
+        status=swap_status_type,
         created_at=sp.timestamp
     )
     
@@ -43,6 +56,14 @@ def main():
         swap_id=sp.nat
     )
     
+    # Admin actions, grouped behind a single entrypoint
+    admin_action_type: type = sp.variant(
+        set_admin=sp.address,
+        set_fee_percentage=sp.nat,
+        set_paused=sp.bool,
+        withdraw_fees=sp.address
+    )
+    
     # FA2 transfer type (defined once at module level)
     fa2_transfer_type: type = sp.list[
         sp.record(
@@ -57,6 +78,14 @@ def main():
         )
     ]
 
+    def fa2_transfer_entrypoint(token_address: sp.address) -> sp.contract[fa2_transfer_type]:
+        """Look up the FA2 `transfer` entrypoint of a token contract"""
+        return sp.contract(
+            fa2_transfer_type,
+            token_address,
+            "transfer"
+        ).unwrap_some(error="INVALID_TOKEN_CONTRACT")
+
     class HTLCEscrow(sp.Contract):
         def __init__(self, admin_address: sp.address):
             """
@@ -68,6 +97,7 @@ def main():
             # Initialize contract storage
             self.data.next_swap_id = sp.nat(1)
             self.data.swaps = sp.cast(sp.big_map(), sp.big_map[sp.nat, swap_type])  
+            self.data.active_swaps = sp.cast(sp.big_map(), sp.big_map[sp.nat, sp.unit])  # Index of active swap IDs for indexers
             self.data.admin = admin_address
             self.data.fee_percentage = sp.nat(10)  # 0.1% fee (10 basis points)
             self.data.collected_fees = sp.mutez(0)
@@ -88,51 +118,42 @@ def main():
             assert params.timelock_hours >= 1, "TIMELOCK_TOO_SHORT"
             assert params.timelock_hours <= 168, "TIMELOCK_TOO_LONG"  # Max 1 week
             
-            # Validate secret hash length (32 bytes for SHA256)
-            assert sp.len(params.secret_hash) == 32, "INVALID_SECRET_HASH_LENGTH"
-            
             # Calculate expiration timestamp
-            timelock_seconds = params.timelock_hours * 3600
-            timelock = sp.add_seconds(sp.now, sp.to_int(timelock_seconds))
+            timelock = sp.add_seconds(sp.now, sp.to_int(params.timelock_hours * 3600))
             
             # Handle token or XTZ deposit
-            amount = sp.mutez(0)
+            asset = sp.cast(sp.variant.xtz(sp.mutez(0)), asset_type)
             if params.token_address.is_some():
                 # FA2 token swap
                 assert params.token_amount.is_some(), "TOKEN_AMOUNT_REQUIRED"
                 assert params.token_amount.unwrap_some() > 0, "INVALID_TOKEN_AMOUNT"
                 
-                # Get token contract
-                token_contract_opt = sp.contract(
-                    fa2_transfer_type,
-                    params.token_address.unwrap_some(),
-                    "transfer"
+                token = sp.record(
+                    token_address=params.token_address.unwrap_some(),
+                    token_id=params.token_id.unwrap_some(),
+                    token_amount=params.token_amount.unwrap_some()
                 )
-                assert token_contract_opt.is_some(), "INVALID_TOKEN_CONTRACT"
-                token_contract = token_contract_opt.unwrap_some()
-                
-                # Prepare transfer parameters
-                transfer_param = [sp.record(
-                    from_=sp.sender,
-                    txs=[sp.record(
-                        to_=sp.self_address,
-                        token_id=params.token_id.unwrap_some(),
-                        amount=params.token_amount.unwrap_some()
-                    )]
-                )]
                 
                 # Transfer tokens to contract
-                sp.transfer(transfer_param, sp.mutez(0), token_contract)
+                self.transfer_fa2(
+                    token_address=token.token_address,
+                    from_=sp.sender,
+                    to_=sp.self_address,
+                    token_id=token.token_id,
+                    amount=token.token_amount
+                )
+                asset = sp.variant.fa2(token)
             else:
                 # XTZ swap
                 assert sp.amount > sp.mutez(0), "AMOUNT_REQUIRED"
                 amount = sp.amount
                 
-                # Calculate and collect fee for XTZ swaps
-                fee_amount = sp.split_tokens(amount, self.data.fee_percentage, 10000)
-                net_amount = sp.amount - fee_amount
-                self.data.collected_fees += fee_amount
-                amount = net_amount
+                # Calculate and collect fee for XTZ swaps (skipped when fees are off)
+                if self.data.fee_percentage > 0:
+                    fee_amount = sp.split_tokens(sp.amount, self.data.fee_percentage, 10000)
+                    self.data.collected_fees += fee_amount
+                    amount = sp.amount - fee_amount
+                asset = sp.variant.xtz(amount)
             
             # Create swap record
             swap_id = self.data.next_swap_id
@@ -140,18 +161,16 @@ def main():
                 swap_id=swap_id,
                 maker=sp.sender,
                 taker=params.taker,
-                amount=amount,
-                token_address=params.token_address,
-                token_id=params.token_id,
-                token_amount=params.token_amount,
+                asset=asset,
                 secret_hash=params.secret_hash,
                 timelock=timelock,
-                status="active",
+                status=sp.variant.active(()),
                 created_at=sp.now
             )
             
             # Store swap and increment counter
             self.data.swaps[swap_id] = swap_data
+            self.data.active_swaps[swap_id] = ()
             self.data.next_swap_id += 1
 
         @sp.entrypoint  
@@ -162,20 +181,19 @@ def main():
             Args:
                 params: Claim parameters with swap_id and secret
             """
-            # Contract must not be paused
-            assert not self.data.paused, "CONTRACT_PAUSED"
-            
-            # Verify swap exists
-            assert self.data.swaps.contains(params.swap_id), "SWAP_NOT_FOUND"
-            swap = self.data.swaps[params.swap_id]
+            # Verify swap exists (claims stay open while paused so funded
+            # swaps are never stranded)
+            swap = self.data.swaps.get_opt(params.swap_id).unwrap_some(error="SWAP_NOT_FOUND")
             
             # Verify swap is active
-            assert swap.status == "active", "SWAP_NOT_ACTIVE"
+            assert swap.status.is_variant.active(), "SWAP_NOT_ACTIVE"
             
             # Verify swap hasn't expired
             assert sp.now < swap.timelock, "SWAP_EXPIRED"
             
-            # Verify secret hash matches
+            # Verify secret hash matches. SHA-256 rather than the cheaper
+            # BLAKE2B: the backend derives secret_hash with SHA-256, which an
+            # EVM counterpart can also check cheaply via its precompile
             computed_hash = sp.sha256(params.secret)
             assert computed_hash == swap.secret_hash, "INVALID_SECRET"
             
@@ -184,44 +202,24 @@ def main():
                 assert sp.sender == swap.taker.unwrap_some(), "UNAUTHORIZED_CLAIMER"
             
             # Update swap status to claimed
-            updated_swap = sp.record(
-                swap_id=swap.swap_id,
-                maker=swap.maker,
-                taker=swap.taker,
-                amount=swap.amount,
-                token_address=swap.token_address,
-                token_id=swap.token_id,
-                token_amount=swap.token_amount,
-                secret_hash=swap.secret_hash,
-                timelock=swap.timelock,
-                status="claimed",
-                created_at=swap.created_at
-            )
-            self.data.swaps[params.swap_id] = updated_swap
+            swap.status = sp.variant.claimed(())
+            self.data.swaps[params.swap_id] = swap
+            del self.data.active_swaps[params.swap_id]
             
             # Transfer escrowed assets
-            if swap.token_address.is_some():
-                # Transfer FA2 tokens to claimer
-                token_contract_opt = sp.contract(
-                    fa2_transfer_type,
-                    swap.token_address.unwrap_some(),
-                    "transfer"
-                )
-                assert token_contract_opt.is_some(), "INVALID_TOKEN_CONTRACT"
-                token_contract = token_contract_opt.unwrap_some()
-                
-                transfer_param = [sp.record(
-                    from_=sp.self_address,
-                    txs=[sp.record(
+            match swap.asset:
+                case fa2(token):
+                    # Transfer FA2 tokens to claimer
+                    self.transfer_fa2(
+                        token_address=token.token_address,
+                        from_=sp.self_address,
                         to_=sp.sender,
-                        token_id=swap.token_id.unwrap_some(),
-                        amount=swap.token_amount.unwrap_some()
-                    )]
-                )]
-                sp.transfer(transfer_param, sp.mutez(0), token_contract)
-            else:
-                # Transfer XTZ to claimer
-                sp.send(sp.sender, swap.amount)
+                        token_id=token.token_id,
+                        amount=token.token_amount
+                    )
+                case xtz(amount):
+                    # Transfer XTZ to claimer
+                    sp.send(sp.sender, amount)
 
         @sp.entrypoint
         def refund_swap(self, params: refund_swap_params):
@@ -232,11 +230,10 @@ def main():
                 params: Refund parameters with swap_id
             """
             # Verify swap exists
-            assert self.data.swaps.contains(params.swap_id), "SWAP_NOT_FOUND"
-            swap = self.data.swaps[params.swap_id]
+            swap = self.data.swaps.get_opt(params.swap_id).unwrap_some(error="SWAP_NOT_FOUND")
             
             # Verify swap is active
-            assert swap.status == "active", "SWAP_NOT_ACTIVE"
+            assert swap.status.is_variant.active(), "SWAP_NOT_ACTIVE"
             
             # Verify timelock has expired
             assert sp.now >= swap.timelock, "SWAP_NOT_EXPIRED"
@@ -245,87 +242,72 @@ def main():
             assert sp.sender == swap.maker, "UNAUTHORIZED_REFUNDER"
             
             # Update swap status to refunded
-            updated_swap = sp.record(
-                swap_id=swap.swap_id,
-                maker=swap.maker,
-                taker=swap.taker,
-                amount=swap.amount,
-                token_address=swap.token_address,
-                token_id=swap.token_id,
-                token_amount=swap.token_amount,
-                secret_hash=swap.secret_hash,
-                timelock=swap.timelock,
-                status="refunded",
-                created_at=swap.created_at
-            )
-            self.data.swaps[params.swap_id] = updated_swap
+            swap.status = sp.variant.refunded(())
+            self.data.swaps[params.swap_id] = swap
+            del self.data.active_swaps[params.swap_id]
             
             # Return escrowed assets to maker
-            if swap.token_address.is_some():
-                # Return FA2 tokens to maker
-                token_contract_opt = sp.contract(
-                    fa2_transfer_type,
-                    swap.token_address.unwrap_some(),
-                    "transfer"
-                )
-                assert token_contract_opt.is_some(), "INVALID_TOKEN_CONTRACT"
-                token_contract = token_contract_opt.unwrap_some()
-                
-                transfer_param = [sp.record(
-                    from_=sp.self_address,
-                    txs=[sp.record(
+            match swap.asset:
+                case fa2(token):
+                    # Return FA2 tokens to maker
+                    self.transfer_fa2(
+                        token_address=token.token_address,
+                        from_=sp.self_address,
                         to_=swap.maker,
-                        token_id=swap.token_id.unwrap_some(),
-                        amount=swap.token_amount.unwrap_some()
-                    )]
-                )]
-                sp.transfer(transfer_param, sp.mutez(0), token_contract)
-            else:
-                # Return XTZ to maker
-                sp.send(swap.maker, swap.amount)
+                        token_id=token.token_id,
+                        amount=token.token_amount
+                    )
+                case xtz(amount):
+                    # Return XTZ to maker
+                    sp.send(swap.maker, amount)
 
-        # Admin functions
-        @sp.entrypoint
-        def set_admin(self, new_admin: sp.address):
-            """Change contract admin (admin only)"""
-            assert sp.sender == self.data.admin, "ADMIN_ONLY"
-            self.data.admin = new_admin
-
-        @sp.entrypoint
-        def set_fee_percentage(self, new_fee: sp.nat):
-            """Set fee percentage (admin only)"""
-            assert sp.sender == self.data.admin, "ADMIN_ONLY"
-            assert new_fee <= 500, "FEE_TOO_HIGH"  # Max 5%
-            self.data.fee_percentage = new_fee
-
-        @sp.entrypoint
-        def pause_contract(self):
-            """Pause contract operations (admin only)"""
-            assert sp.sender == self.data.admin, "ADMIN_ONLY"
-            self.data.paused = True
-
-        @sp.entrypoint
-        def unpause_contract(self):
-            """Unpause contract operations (admin only)"""
-            assert sp.sender == self.data.admin, "ADMIN_ONLY"
-            self.data.paused = False
+        # Internal helpers
+        @sp.private(with_operations=True)
+        def transfer_fa2(
+            self,
+            token_address: sp.address,
+            from_: sp.address,
+            to_: sp.address,
+            token_id: sp.nat,
+            amount: sp.nat
+        ):
+            """Transfer a single FA2 token amount between two addresses"""
+            sp.transfer(
+                [sp.record(
+                    from_=from_,
+                    txs=[sp.record(to_=to_, token_id=token_id, amount=amount)]
+                )],
+                sp.mutez(0),
+                fa2_transfer_entrypoint(token_address)
+            )
 
+        # Admin functions
         @sp.entrypoint
-        def withdraw_fees(self, recipient: sp.address):
-            """Withdraw collected fees (admin only)"""
+        def admin(self, action: admin_action_type):
+            """Run a contract management action (admin only)"""
             assert sp.sender == self.data.admin, "ADMIN_ONLY"
-            assert self.data.collected_fees > sp.mutez(0), "NO_FEES_TO_WITHDRAW"
             
-            amount = self.data.collected_fees
-            self.data.collected_fees = sp.mutez(0)
-            sp.send(recipient, amount)
+            match action:
+                case set_admin(new_admin):
+                    self.data.admin = new_admin
+                case set_fee_percentage(new_fee):
+                    assert new_fee <= 500, "FEE_TOO_HIGH"  # Max 5%
+                    self.data.fee_percentage = new_fee
+                case set_paused(paused):
+                    # Only gates swap creation
+                    self.data.paused = paused
+                case withdraw_fees(recipient):
+                    assert self.data.collected_fees > sp.mutez(0), "NO_FEES_TO_WITHDRAW"
+                    
+                    amount = self.data.collected_fees
+                    self.data.collected_fees = sp.mutez(0)
+                    sp.send(recipient, amount)
 
         # View functions
         @sp.onchain_view
         def get_swap(self, swap_id: sp.nat) -> swap_type:
             """Get swap details by ID"""
-            assert self.data.swaps.contains(swap_id), "SWAP_NOT_FOUND"
-            return self.data.swaps[swap_id]
+            return self.data.swaps.get_opt(swap_id).unwrap_some(error="SWAP_NOT_FOUND")
 
         @sp.onchain_view
         def get_next_swap_id(self) -> sp.nat:
@@ -345,9 +327,45 @@ def main():
 
 
 
+@sp.module
+def testing():
+    ledger_type: type = sp.map[sp.pair[sp.address, sp.nat], sp.nat]
+    
+    transfer_type: type = sp.list[
+        sp.record(
+            from_=sp.address,
+            txs=sp.list[
+                sp.record(
+                    to_=sp.address,
+                    token_id=sp.nat,
+                    amount=sp.nat
+                )
+            ]
+        )
+    ]
+
+    class FA2Mock(sp.Contract):
+        """Minimal FA2 ledger with a `transfer` entrypoint (no operator checks)"""
+
+        def __init__(self, ledger: ledger_type):
+            self.data.ledger = ledger
+
+        @sp.entrypoint
+        def transfer(self, batch: transfer_type):
+            for transfer in batch:
+                for tx in transfer.txs:
+                    from_key = (transfer.from_, tx.token_id)
+                    to_key = (tx.to_, tx.token_id)
+                    self.data.ledger[from_key] = sp.as_nat(
+                        self.data.ledger.get(from_key, default=0) - tx.amount,
+                        error="FA2_INSUFFICIENT_BALANCE"
+                    )
+                    self.data.ledger[to_key] = self.data.ledger.get(to_key, default=0) + tx.amount
+
+
 @sp.add_test()
 def test():
-    scenario = sp.test_scenario("HTLCEscrow tests", main)
+    scenario = sp.test_scenario("HTLCEscrow tests", [main, testing])
     
     # Test accounts
     admin = sp.test_account("admin")
@@ -380,6 +398,8 @@ def test():
         secret=secret,
         _sender=bob.address
     )
+    scenario.verify(htlc.data.swaps[1].status.is_variant.claimed())
+    scenario.verify(not htlc.data.active_swaps.contains(1))
     
     # Test 3: Create another swap for refund test
     htlc.create_swap(
@@ -393,6 +413,8 @@ def test():
         _amount=sp.tez(2)
     )
     
+    scenario.verify(htlc.data.active_swaps.contains(2))
+    
     # Test 4: Invalid claim with wrong secret should fail
     wrong_secret = sp.bytes("0x" + "34" * 32)
     htlc.claim_swap(
@@ -402,5 +424,155 @@ def test():
         _valid=False
     )
     
+    # Test 5: Pausing blocks new swaps but not claims of existing ones
+    htlc.create_swap(
+        taker=sp.some(bob.address),
+        secret_hash=secret_hash,
+        timelock_hours=24,
+        token_address=sp.none,
+        token_id=sp.none,
+        token_amount=sp.none,
+        _sender=alice.address,
+        _amount=sp.tez(1)
+    )
+    htlc.admin(sp.variant.set_paused(True), _sender=admin.address)
+    htlc.create_swap(
+        taker=sp.none,
+        secret_hash=secret_hash,
+        timelock_hours=24,
+        token_address=sp.none,
+        token_id=sp.none,
+        token_amount=sp.none,
+        _sender=alice.address,
+        _amount=sp.tez(1),
+        _valid=False,
+        _exception="CONTRACT_PAUSED"
+    )
+    htlc.claim_swap(
+        swap_id=3,
+        secret=secret,
+        _sender=bob.address
+    )
+    scenario.verify(htlc.data.swaps[3].status.is_variant.claimed())
+    
+    # Test 6: Refund of an expired swap while paused
+    htlc.refund_swap(
+        swap_id=2,
+        _sender=alice.address,
+        _now=sp.timestamp(2 * 3600)
+    )
+    scenario.verify(htlc.data.swaps[2].status.is_variant.refunded())
+    scenario.verify(not htlc.data.active_swaps.contains(2))
+    htlc.admin(sp.variant.set_paused(False), _sender=admin.address)
+    
+    # Test 7: Zero fee escrows the full amount and collects nothing
+    htlc.admin(sp.variant.set_fee_percentage(0), _sender=admin.address)
+    htlc.create_swap(
+        taker=sp.none,
+        secret_hash=secret_hash,
+        timelock_hours=24,
+        token_address=sp.none,
+        token_id=sp.none,
+        token_amount=sp.none,
+        _sender=alice.address,
+        _amount=sp.tez(1)
+    )
+    scenario.verify(htlc.data.swaps[4].asset.unwrap.xtz() == sp.tez(1))
+    scenario.verify(htlc.data.collected_fees == sp.mutez(4000))
+    
+    # Test 8: Admin actions are restricted to the admin
+    htlc.admin(
+        sp.variant.withdraw_fees(alice.address),
+        _sender=alice.address,
+        _valid=False,
+        _exception="ADMIN_ONLY"
+    )
+    htlc.admin(sp.variant.withdraw_fees(admin.address), _sender=admin.address)
+    scenario.verify(htlc.data.collected_fees == sp.mutez(0))
+    
+    # Test 9: FA2 swaps escrow tokens and release them on claim or refund
+    token = testing.FA2Mock(sp.map({(alice.address, 0): 100}))
+    scenario += token
+    
+    htlc.create_swap(
+        taker=sp.some(bob.address),
+        secret_hash=secret_hash,
+        timelock_hours=24,
+        token_address=sp.some(token.address),
+        token_id=sp.some(0),
+        token_amount=sp.some(30),
+        _sender=alice.address,
+        _now=sp.timestamp(10000)
+    )
+    scenario.verify(htlc.data.swaps[5].asset.is_variant.fa2())
+    scenario.verify(htlc.data.swaps[5].asset.unwrap.fa2().token_address == token.address)
+    scenario.verify(htlc.data.swaps[5].asset.unwrap.fa2().token_id == 0)
+    scenario.verify(htlc.data.swaps[5].asset.unwrap.fa2().token_amount == 30)
+    scenario.verify(token.data.ledger[(alice.address, 0)] == 70)
+    scenario.verify(token.data.ledger[(htlc.address, 0)] == 30)
+    
+    htlc.claim_swap(
+        swap_id=5,
+        secret=secret,
+        _sender=bob.address,
+        _now=sp.timestamp(10001)
+    )
+    scenario.verify(htlc.data.swaps[5].status.is_variant.claimed())
+    scenario.verify(token.data.ledger[(bob.address, 0)] == 30)
+    scenario.verify(token.data.ledger[(htlc.address, 0)] == 0)
+    
+    htlc.create_swap(
+        taker=sp.none,
+        secret_hash=secret_hash,
+        timelock_hours=1,
+        token_address=sp.some(token.address),
+        token_id=sp.some(0),
+        token_amount=sp.some(20),
+        _sender=alice.address,
+        _now=sp.timestamp(10000)
+    )
+    scenario.verify(token.data.ledger[(alice.address, 0)] == 50)
+    htlc.refund_swap(
+        swap_id=6,
+        _sender=alice.address,
+        _now=sp.timestamp(10000 + 2 * 3600)
+    )
+    scenario.verify(htlc.data.swaps[6].status.is_variant.refunded())
+    scenario.verify(token.data.ledger[(alice.address, 0)] == 70)
+    scenario.verify(token.data.ledger[(htlc.address, 0)] == 0)
+    
+    # Test 10: A token address without an FA2 transfer entrypoint is rejected
+    htlc.create_swap(
+        taker=sp.none,
+        secret_hash=secret_hash,
+        timelock_hours=24,
+        token_address=sp.some(htlc.address),
+        token_id=sp.some(0),
+        token_amount=sp.some(10),
+        _sender=alice.address,
+        _valid=False,
+        _exception="INVALID_TOKEN_CONTRACT"
+    )
+    
+    # Test 11: Fee above the 5% cap is rejected
+    htlc.admin(
+        sp.variant.set_fee_percentage(501),
+        _sender=admin.address,
+        _valid=False,
+        _exception="FEE_TOO_HIGH"
+    )
+    
+    # Test 12: Admin handover moves admin rights to the new admin
+    htlc.admin(sp.variant.set_admin(bob.address), _sender=admin.address)
+    scenario.verify(htlc.data.admin == bob.address)
+    htlc.admin(
+        sp.variant.set_paused(True),
+        _sender=admin.address,
+        _valid=False,
+        _exception="ADMIN_ONLY"
+    )
+    htlc.admin(sp.variant.set_fee_percentage(20), _sender=bob.address)
+    scenario.verify(htlc.data.fee_percentage == 20)
+    
     # Verify contract state
-    scenario.verify(htlc.data.next_swap_id == 3)
\ No newline at end of file
+    scenario.verify(htlc.data.next_swap_id == 7)
\ No newline at end of file
@@ -303,23 +303,25 @@ export class ContractService {
       }
 
       const storage = await this.tezosContract.storage();
-      const swap = storage.swaps.get(swapId.toString());
+      const swap: any = await storage.swaps.get(swapId.toString());
       
       if (!swap) {
         return null;
       }
 
+      const token = swap.asset.fa2;
+
       return {
-        swap_id: swap.swap_id,
+        swap_id: Number(swap.swap_id),
         maker: swap.maker,
         taker: swap.taker || undefined,
-        amount: swap.amount,
-        token_address: swap.token_address || undefined,
-        token_id: swap.token_id || undefined,
-        token_amount: swap.token_amount || undefined,
+        amount: token ? 0 : Number(swap.asset.xtz),
+        token_address: token?.token_address,
+        token_id: token ? Number(token.token_id) : undefined,
+        token_amount: token ? Number(token.token_amount) : undefined,
         secret_hash: swap.secret_hash,
         timelock: swap.timelock,
-        status: swap.status,
+        status: Object.keys(swap.status)[0] as TezosSwapData['status'],
         created_at: swap.created_at
       };
       
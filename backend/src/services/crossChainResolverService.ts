@@ -273,8 +273,8 @@ export class CrossChainResolverService {
       const contract = await toolkit.contract.at(contractAddress);
       const storage: any = await contract.storage();
       
-      const htlc = storage.swaps.get(htlcId.toString());
-      return htlc && htlc.status === 'active';
+      const htlc = await storage.swaps.get(htlcId.toString());
+      return htlc && 'active' in htlc.status;
     } catch (error) {
       Logger.warn('Failed to check Tezos HTLC status', error);
       return false;